@@ -0,0 +1,330 @@
+"""
+Layanan HTTP JSON untuk proyeksi Monte Carlo, terpisah dari UI Streamlit.
+
+Menyajikan hasil yang sama dengan halaman Streamlit (persentil, distribusi,
+statistik, teks media sosial) tanpa perlu men-scrape halaman.
+
+Jalankan:
+    python api.py --host 127.0.0.1 --port 8502 --workers 4 --antrian 16
+
+Endpoint:
+    GET /proyeksi?ticker=BTC-USD&days=30
+    GET /kesehatan
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import socket
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Callable, Dict, Hashable, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pytz
+
+from simulasi import (
+    COINGECKO_MAP,
+    HORIZONS,
+    unduh_data_harga,
+    ringkasan_proyeksi,
+)
+
+CACHE_TTL_DETIK = 3600
+
+# ════════════════════════════════════════════════
+# CACHE & SINGLEFLIGHT
+# ════════════════════════════════════════════════
+
+class CacheTTL:
+    """
+    Cache dict thread-safe dengan masa berlaku per entri. Entri kedaluwarsa
+    dibuang saat dibaca dan disapu setiap kali ada entri baru disimpan, agar
+    kunci yang tidak pernah dibaca lagi (mis. tanggal kemarin) tidak menumpuk.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def ambil(self, kunci: Hashable) -> Tuple[bool, Any]:
+        """Returns (ada, nilai). Entri kedaluwarsa dibuang."""
+        with self._lock:
+            entri = self._data.get(kunci)
+            if entri is None:
+                return False, None
+            kedaluwarsa, nilai = entri
+            if time.monotonic() >= kedaluwarsa:
+                del self._data[kunci]
+                return False, None
+            return True, nilai
+
+    def simpan(self, kunci: Hashable, nilai: Any) -> None:
+        with self._lock:
+            sekarang = time.monotonic()
+            kedaluwarsa = [k for k, (t, _) in self._data.items() if sekarang >= t]
+            for k in kedaluwarsa:
+                del self._data[k]
+            self._data[kunci] = (sekarang + self.ttl, nilai)
+
+
+class SingleFlight:
+    """
+    Gabungkan pemanggilan konkuren dengan kunci yang sama menjadi satu
+    eksekusi. Pemanggil lain menunggu dan menerima hasil (atau error) yang sama.
+    """
+
+    def __init__(self) -> None:
+        self._berjalan: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def lakukan(self, kunci: Hashable, fungsi: Callable[[], Any]) -> Any:
+        with self._lock:
+            fut = self._berjalan.get(kunci)
+            pemimpin = fut is None
+            if pemimpin:
+                fut = Future()
+                self._berjalan[kunci] = fut
+
+        if not pemimpin:
+            return fut.result()
+
+        try:
+            fut.set_result(fungsi())
+        except BaseException as e:
+            fut.set_exception(e)
+        finally:
+            with self._lock:
+                del self._berjalan[kunci]
+        return fut.result()
+
+# ════════════════════════════════════════════════
+# LAYANAN PROYEKSI
+# ════════════════════════════════════════════════
+
+class LayananProyeksi:
+    """Data harga & hasil proyeksi, di-cache dan digabung per kunci."""
+
+    def __init__(self, ttl: float = CACHE_TTL_DETIK) -> None:
+        self._cache_data  = CacheTTL(ttl)
+        self._cache_hasil = CacheTTL(ttl)
+        self._flight = SingleFlight()
+        self._wib = pytz.timezone("Asia/Jakarta")
+
+    def _data_harga(self, coin_id: str) -> pd.DataFrame:
+        ada, df = self._cache_data.ambil(coin_id)
+        if ada:
+            return df
+
+        def unduh() -> pd.DataFrame:
+            # Cek ulang: pemimpin sebelumnya bisa saja baru selesai menyimpan.
+            ada, df = self._cache_data.ambil(coin_id)
+            if ada:
+                return df
+            df = unduh_data_harga(coin_id)
+            self._cache_data.simpan(coin_id, df)
+            return df
+
+        return self._flight.lakukan(("data", coin_id), unduh)
+
+    def proyeksi(self, ticker: str, days: int) -> dict:
+        today_str = datetime.now(self._wib).strftime("%Y-%m-%d")
+        kunci = (ticker, days, today_str)
+
+        ada, hasil = self._cache_hasil.ambil(kunci)
+        if ada:
+            return hasil
+
+        def hitung() -> dict:
+            ada, hasil = self._cache_hasil.ambil(kunci)
+            if ada:
+                return hasil
+            df = self._data_harga(COINGECKO_MAP[ticker])
+            hasil = ringkasan_proyeksi(df, ticker, days, today_str)
+            self._cache_hasil.simpan(kunci, hasil)
+            return hasil
+
+        return self._flight.lakukan(("proyeksi",) + kunci, hitung)
+
+# ════════════════════════════════════════════════
+# SERVER HTTP
+# ════════════════════════════════════════════════
+
+def _jawaban_json(status: int, alasan: str, isi: dict) -> bytes:
+    """Respons HTTP/1.0 lengkap (header + body JSON) sebagai bytes."""
+    body = json.dumps(isi, ensure_ascii=False).encode("utf-8")
+    header = (
+        f"HTTP/1.0 {status} {alasan}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    return header.encode("latin-1") + body
+
+
+class ServerPool(HTTPServer):
+    """
+    HTTPServer yang menangani permintaan di worker pool berukuran tetap.
+    Permintaan yang sedang diproses atau menunggu worker dibatasi
+    workers + antrian; sisanya dijawab 503 oleh thread penolak terpisah
+    tanpa membaca permintaannya, sehingga loop accept tidak pernah
+    menunggu klien.
+    """
+
+    # Backlog listen; default socketserver (5) terlalu kecil untuk lonjakan.
+    request_queue_size = 128
+
+    # Batas waktu satu penolakan (kirim 503 + kuras sisa permintaan).
+    timeout_tolak = 2.0
+
+    # Penolakan yang boleh menunggu thread penolak; lebih dari ini koneksi
+    # langsung ditutup.
+    maks_tolak = 64
+
+    jawaban_sibuk = _jawaban_json(
+        503, "Service Unavailable",
+        {"error": "Server sedang sibuk. Coba lagi beberapa saat."},
+    )
+
+    def __init__(
+        self,
+        alamat,
+        handler,
+        workers: int,
+        antrian: int,
+        layanan: LayananProyeksi,
+    ):
+        super().__init__(alamat, handler)
+        self.layanan = layanan
+        self._slot = threading.BoundedSemaphore(workers + antrian)
+        self._slot_tolak = threading.BoundedSemaphore(self.maks_tolak)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api")
+        self._pool_tolak = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="api-tolak"
+        )
+
+    def process_request(self, request, client_address):
+        if self._slot.acquire(blocking=False):
+            self._pool.submit(self._proses, request, client_address)
+        elif self._slot_tolak.acquire(blocking=False):
+            self._pool_tolak.submit(self._tolak, request)
+        else:
+            self.shutdown_request(request)
+
+    def _proses(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._slot.release()
+
+    def _tolak(self, request):
+        batas = time.monotonic() + self.timeout_tolak
+        try:
+            request.settimeout(self.timeout_tolak)
+            request.sendall(self.jawaban_sibuk)
+            request.shutdown(socket.SHUT_WR)
+            # Kuras permintaan yang belum dibaca; menutup socket dengan data
+            # tersisa mengirim RST dan klien bisa kehilangan jawaban 503.
+            while time.monotonic() < batas:
+                request.settimeout(max(batas - time.monotonic(), 0.01))
+                if not request.recv(4096):
+                    break
+        except OSError:
+            pass
+        finally:
+            self.close_request(request)
+            self._slot_tolak.release()
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=True)
+        self._pool_tolak.shutdown(wait=True)
+
+
+class HandlerProyeksi(BaseHTTPRequestHandler):
+    server: ServerPool
+
+    def _kirim_json(self, status: int, isi: dict) -> None:
+        body = json.dumps(isi, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+
+        if url.path == "/kesehatan":
+            self._kirim_json(200, {"status": "ok"})
+            return
+        if url.path != "/proyeksi":
+            self._kirim_json(404, {"error": "Endpoint tidak ditemukan."})
+            return
+
+        query  = parse_qs(url.query)
+        ticker = query.get("ticker", [""])[0].upper()
+        if ticker not in COINGECKO_MAP:
+            self._kirim_json(400, {"error": f"Ticker tidak dikenal: {ticker!r}."})
+            return
+        try:
+            days = int(query.get("days", [""])[0])
+        except ValueError:
+            days = None
+        if days not in HORIZONS:
+            self._kirim_json(
+                400, {"error": f"days harus salah satu dari {HORIZONS}."}
+            )
+            return
+
+        try:
+            hasil = self.server.layanan.proyeksi(ticker, days)
+        except ConnectionError as e:
+            self._kirim_json(502, {"error": str(e)})
+            return
+        except ValueError as e:
+            self._kirim_json(422, {"error": str(e)})
+            return
+
+        self._kirim_json(200, hasil)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--antrian", type=int, default=16,
+                        help="permintaan yang boleh menunggu worker sebelum dijawab 503")
+    args = parser.parse_args()
+
+    server = ServerPool(
+        (args.host, args.port),
+        HandlerProyeksi,
+        args.workers,
+        args.antrian,
+        LayananProyeksi(),
+    )
+    print(f"API proyeksi berjalan di http://{args.host}:{args.port} "
+          f"({args.workers} worker, antrian {args.antrian})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
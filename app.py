@@ -1,13 +1,37 @@
 from __future__ import annotations
 
-import hashlib
+import functools
+import os
+import time
 import streamlit as st
 import numpy as np
 import pandas as pd
 from datetime import datetime
-from typing import Tuple
+from typing import Callable, Tuple
 import pytz
-import requests
+
+from penjadwal import AntrianPenuh, PenjadwalSimulasi, TiketSimulasi
+from simulasi import (
+    HORIZON_TO_PERIOD,
+    HORIZONS,
+    PERSENTIL,
+    COINGECKO_MAP,
+    TICKER_OPTIONS,
+    fmt,
+    pct,
+    pct_chg,
+    unduh_data_harga,
+    hitung_parameter,
+    hitung_seed,
+    jalankan_simulasi,
+    perkiraan_memori_simulasi,
+    distribusi_peluang,
+    rentang_teratas,
+    statistik_simulasi,
+    buat_teks_sosial,
+    buat_csv,
+    buat_npz,
+)
 
 # ════════════════════════════════════════════════
 # KONFIGURASI HALAMAN
@@ -18,44 +42,6 @@ st.set_page_config(
     layout="centered"
 )
 
-# ════════════════════════════════════════════════
-# KONSTANTA
-# ════════════════════════════════════════════════
-
-HORIZON_TO_PERIOD: dict = {
-    3:   60,
-    7:   60,
-    30:  180,
-    90:  365,
-    365: 365,
-}
-
-HORIZONS = [3, 7, 30, 90, 365]
-MAX_PERIOD = max(HORIZON_TO_PERIOD.values())
-
-COINGECKO_MAP = {
-    "BTC-USD": "bitcoin",          "ETH-USD": "ethereum",         "BNB-USD": "binancecoin",
-    "USDT-USD": "tether",          "SOL-USD": "solana",            "XRP-USD": "ripple",
-    "TON-USD": "toncoin",          "DOGE-USD": "dogecoin",         "ADA-USD": "cardano",
-    "AVAX-USD": "avalanche-2",     "SHIB-USD": "shiba-inu",        "WETH-USD": "weth",
-    "DOT-USD": "polkadot",         "TRX-USD": "tron",              "WBTC-USD": "wrapped-bitcoin",
-    "LINK-USD": "chainlink",       "MATIC-USD": "matic-network",   "ICP-USD": "internet-computer",
-    "LTC-USD": "litecoin",         "BCH-USD": "bitcoin-cash",      "NEAR-USD": "near",
-    "UNI-USD": "uniswap",          "PEPE-USD": "pepe",             "LEO-USD": "leo-token",
-    "DAI-USD": "dai",              "APT-USD": "aptos",             "STETH-USD": "staked-ether",
-    "XLM-USD": "stellar",          "OKB-USD": "okb",               "ETC-USD": "ethereum-classic",
-    "CRO-USD": "crypto-com-chain", "FIL-USD": "filecoin",          "RNDR-USD": "render-token",
-    "ATOM-USD": "cosmos",          "HBAR-USD": "hedera-hashgraph", "KAS-USD": "kaspa",
-    "IMX-USD": "immutable-x",      "TAO-USD": "bittensor",         "VET-USD": "vechain",
-    "MNT-USD": "mantle",           "FET-USD": "fetch-ai",          "LDO-USD": "lido-dao",
-    "TONCOIN-USD": "toncoin",      "AR-USD": "arweave",            "INJ-USD": "injective-protocol",
-    "GRT-USD": "the-graph",        "BTCB-USD": "bitcoin-bep2",     "USDC-USD": "usd-coin",
-    "SUI-USD": "sui",              "BGB-USD": "bitget-token",      "XTZ-USD": "tezos",
-    "MUBARAK-USD": "mubarakcoin",
-}
-
-TICKER_OPTIONS = sorted(COINGECKO_MAP.keys())
-
 # ════════════════════════════════════════════════
 # CSS GLOBAL
 # ════════════════════════════════════════════════
@@ -103,41 +89,50 @@ tr.kesimpulan-row td {
 """, unsafe_allow_html=True)
 
 # ════════════════════════════════════════════════
-# UTILITAS FORMAT
+# PENGUKURAN WAKTU FRAGMEN
 # ════════════════════════════════════════════════
 
-def fmt(val) -> str:
-    """Format angka ke format Indonesia (titik=ribuan, koma=desimal)."""
-    try:
-        val = float(val)
-    except (TypeError, ValueError):
-        return str(val)
-    if abs(val) < 1:
-        s = f"{val:,.8f}"
-    else:
-        s = f"{val:,.0f}"
-    return s.replace(",", "X").replace(".", ",").replace("X", ".")
+def tampilkan_waktu() -> bool:
+    """Waktu rerun ditampilkan bila URL memuat ?waktu=1 atau MC_TAMPILKAN_WAKTU=1."""
+    return (
+        st.query_params.get("waktu") == "1"
+        or os.environ.get("MC_TAMPILKAN_WAKTU") == "1"
+    )
 
 
-def pct(val) -> str:
-    """Format persen ke format Indonesia."""
-    try:
-        val = float(val)
-    except (TypeError, ValueError):
-        return str(val)
-    return f"{val:.1f}".replace(".", ",") + "%"
+def catat_waktu(nama: str, mulai: float) -> float:
+    """
+    Simpan durasi (ms) sejak `mulai` ke st.session_state["waktu_fragmen"][nama],
+    agar biaya tiap rerun bisa dibandingkan. Returns durasi dalam ms.
+    """
+    ms = (time.perf_counter() - mulai) * 1000
+    st.session_state.setdefault("waktu_fragmen", {})[nama] = ms
+    return ms
 
 
-def pct_chg(val: float, base: float) -> Tuple[str, bool]:
+def diukur(nama: str) -> Callable:
     """
-    Hitung persentase perubahan dari base.
-    Returns (teks_format, is_up).
+    Dekorator: catat waktu eksekusi fungsi (mis. satu fragmen) via catat_waktu
+    dan, bila tampilkan_waktu(), tulis sebagai caption di awal fragmen.
     """
-    p = (val - base) / base * 100
-    is_up = p >= 0
-    arah = "naik" if is_up else "turun"
-    return f"{arah} {abs(p):.1f}%".replace(".", ","), is_up
+    def dekorator(fungsi: Callable) -> Callable:
+        @functools.wraps(fungsi)
+        def pembungkus(*args, **kwargs):
+            slot  = st.empty() if tampilkan_waktu() else None
+            mulai = time.perf_counter()
+            try:
+                hasil = fungsi(*args, **kwargs)
+            finally:
+                ms = catat_waktu(nama, mulai)
+            if slot is not None:
+                slot.caption(f"⏱️ Rerun fragmen {nama}: {ms:.0f} ms")
+            return hasil
+        return pembungkus
+    return dekorator
 
+# ════════════════════════════════════════════════
+# UTILITAS FORMAT
+# ════════════════════════════════════════════════
 
 def interpretasi_skewness(skewness: float) -> str:
     skew_fmt = fmt(skewness)
@@ -170,62 +165,35 @@ def ambil_data_harga(coin_id: str) -> pd.DataFrame:
     Ambil data harga historis harian dari CoinGecko.
     Cache selama 1 jam. Satu panggilan untuk semua horizon.
     """
-    url = f"https://api.coingecko.com/api/v3/coins/{coin_id}/market_chart"
-    params = {"vs_currency": "usd", "days": str(MAX_PERIOD)}
-
-    try:
-        resp = requests.get(url, params=params, timeout=15)
-        resp.raise_for_status()
-    except requests.exceptions.Timeout:
-        raise ConnectionError(
-            "Permintaan ke CoinGecko habis waktu (timeout). Coba lagi beberapa saat."
-        )
-    except requests.exceptions.HTTPError as e:
-        status = e.response.status_code if e.response else "?"
-        if status == 429:
-            raise ConnectionError(
-                "Batas permintaan API CoinGecko terlampaui (429). "
-                "Tunggu beberapa menit lalu coba lagi."
-            )
-        raise ConnectionError(
-            f"API CoinGecko mengembalikan error HTTP {status}. "
-            "Periksa koneksi internet atau coba lagi."
-        )
-    except requests.exceptions.ConnectionError:
-        raise ConnectionError(
-            "Tidak dapat terhubung ke CoinGecko. Periksa koneksi internet Anda."
-        )
-
-    prices = resp.json().get("prices", [])
-    if len(prices) < 60:
-        raise ValueError(
-            "Data historis tidak mencukupi (minimal 60 hari). Coba pilih koin lain."
-        )
-
-    dates  = [datetime.fromtimestamp(p[0] / 1000).date() for p in prices]
-    closes = [p[1] for p in prices]
-    return pd.DataFrame({"Date": dates, "Close": closes}).set_index("Date")
+    return unduh_data_harga(coin_id)
 
 
-def hitung_parameter(df: pd.DataFrame, periode: int) -> Tuple[float, float]:
-    """Hitung mu & sigma log-return dari N hari terakhir."""
-    n_slice = min(periode + 1, len(df))
-    df_slice = df.iloc[-n_slice:]
-    log_ret = np.log(df_slice["Close"] / df_slice["Close"].shift(1)).dropna()
-    return float(log_ret.mean()), float(log_ret.std())
+@st.cache_resource
+def penjadwal_simulasi() -> PenjadwalSimulasi:
+    """Satu penjadwal untuk seluruh sesi dalam proses Streamlit ini."""
+    return PenjadwalSimulasi.dari_env()
 
 
-def jalankan_simulasi(
-    current_price: float,
-    mu: float,
-    sigma: float,
-    days: int,
-    seed: int,
-) -> np.ndarray:
-    """Monte Carlo GBM, vektorisasi penuh (100.000 jalur)."""
-    rng = np.random.default_rng(seed)
-    log_returns = rng.normal(mu, sigma, size=(days, 100_000))
-    return current_price * np.exp(np.sum(log_returns, axis=0))
+def tunggu_simulasi(tiket: TiketSimulasi, days: int) -> np.ndarray:
+    """
+    Tampilkan posisi antrian selama menunggu, lalu kembalikan hasil simulasi.
+    Tiket selalu dilepas, juga saat rerun/tab ditutup menghentikan skrip di
+    tengah penantian, agar pekerjaan yang ditinggalkan dibatalkan.
+    """
+    status = st.empty()
+    try:
+        while not tiket.tunggu(timeout=0.25):
+            posisi = tiket.posisi()
+            if posisi > 0:
+                status.info(
+                    f"⏳ Server sedang sibuk — simulasi Anda berada di antrian ke-{posisi}."
+                )
+            else:
+                status.info(f"Menjalankan 100.000 simulasi untuk {days} hari…")
+        status.empty()
+        return tiket.hasil()
+    finally:
+        tiket.lepas()
 
 # ════════════════════════════════════════════════
 # KOMPONEN HTML — FITUR 1: METRIC CARDS
@@ -352,14 +320,9 @@ def render_tabel_distribusi(
     Baris teratas (peluang max) diberi warna hijau dengan teks gelap.
     Returns (total_peluang_top3, rentang_bawah, rentang_atas).
     """
-    bins  = np.linspace(finals.min(), finals.max(), 10)
-    counts, _ = np.histogram(finals, bins=bins)
-    probs = counts / len(finals) * 100
+    probs, bins = distribusi_peluang(finals)
     idx_sorted = np.argsort(probs)[::-1]
-
-    total_peluang = 0.0
-    rentang_bawah = float("inf")
-    rentang_atas  = 0.0
+    total_peluang, rentang_bawah, rentang_atas = rentang_teratas(probs, bins)
     rows = ""
 
     for rank, id_sort in enumerate(idx_sorted):
@@ -377,11 +340,6 @@ def render_tabel_distribusi(
             f"</tr>"
         )
 
-        if rank < 3:
-            total_peluang += probs[id_sort]
-            rentang_bawah  = min(rentang_bawah, low)
-            rentang_atas   = max(rentang_atas, high)
-
     # Baris keterangan warna
     rows += (
         "<tr class='keterangan-row'>"
@@ -412,11 +370,12 @@ def render_tabel_distribusi(
 
 def render_tabel_statistik(finals: np.ndarray) -> Tuple[float, float]:
     """Tabel statistik ringkasan + kesimpulan. Returns (harga_mean, chance)."""
-    mean_log  = float(np.mean(np.log(finals)))
-    harga_mean = float(np.exp(mean_log))
-    chance    = float(np.mean(finals > harga_mean) * 100)
-    std_dev   = float(np.std(finals))
-    skewness  = float(pd.Series(finals).skew())
+    statistik  = statistik_simulasi(finals)
+    mean_log   = statistik["mean_log"]
+    harga_mean = statistik["harga_mean"]
+    chance     = statistik["chance"]
+    std_dev    = statistik["std_dev"]
+    skewness   = statistik["skewness"]
 
     kesimpulan = (
         f"Median geometrik diperkirakan <strong>US${fmt(harga_mean)}</strong>. "
@@ -567,37 +526,166 @@ selalu menghasilkan angka yang identik — sehingga bisa direproduksi dan diband
     )
 
 # ════════════════════════════════════════════════
-# DOWNLOAD CSV
+# FRAGMEN: PROYEKSI & BAGIKAN
 # ════════════════════════════════════════════════
 
-def buat_csv(
-    finals: np.ndarray,
-    current_price: float,
+@st.fragment
+@diukur("bagikan")
+def fragmen_bagikan(
+    social_text: str,
+    csv_data: str,
+    npz_data: Callable[[], bytes],
     ticker: str,
     days: int,
-) -> str:
-    """Buat string CSV dari persentil dan distribusi peluang."""
-    lines = [f"Proyeksi Monte Carlo — {ticker} — {days} hari\n"]
+) -> None:
+    """
+    Teks media sosial & tombol unduh. Semua isi sudah dihitung oleh
+    fragmen_proyeksi, sehingga mengedit teks tidak menghitung ulang apa pun.
+    Arsip .npz (~800 KB) baru dibuat saat tombolnya diklik.
+    """
+    st.text_area(
+        label="Teks untuk media sosial",
+        value=social_text,
+        height=90,
+        key=f"social_{ticker}_{days}",
+    )
 
-    lines.append("Persentil,Harga (USD),Perubahan (%)")
-    for p in [10, 25, 50, 75, 90]:
-        val = float(np.percentile(finals, p))
-        chg = (val - current_price) / current_price * 100
-        lines.append(f"P{p},{val:.2f},{chg:.2f}%")
+    st.download_button(
+        label="⬇️ Unduh hasil sebagai CSV",
+        data=csv_data,
+        file_name=f"monte_carlo_{ticker}_{days}hari.csv",
+        mime="text/csv",
+    )
+    st.download_button(
+        label="⬇️ Unduh 100.000 harga akhir simulasi (.npz)",
+        data=npz_data,
+        file_name=f"monte_carlo_{ticker}_{days}hari.npz",
+        mime="application/octet-stream",
+        help="Format NumPy: np.load(file) berisi `finals` dan metadata simulasi.",
+    )
 
-    lines.append("\nPeluang (%),Rentang Bawah (USD),Rentang Atas (USD)")
-    bins = np.linspace(finals.min(), finals.max(), 10)
-    counts, _ = np.histogram(finals, bins=bins)
-    probs = counts / len(finals) * 100
-    for i, p in enumerate(probs):
-        lines.append(f"{p:.2f}%,{bins[i]:.2f},{bins[i+1]:.2f}")
 
-    return "\n".join(lines)
+@st.fragment
+@diukur("proyeksi")
+def fragmen_proyeksi(ticker_input: str, df: pd.DataFrame, today_str: str) -> None:
+    """
+    Pemilihan horizon, simulasi, dan seluruh hasilnya. Mengganti horizon
+    hanya menjalankan ulang fragmen ini — header, CSS, dan pengambilan data
+    di luar fragmen dilewati.
+    """
+    days = st.radio(
+        "Horizon proyeksi",
+        HORIZONS,
+        format_func=lambda x: f"{x} Hari",
+        horizontal=True,
+        key="days",
+    )
+    periode = HORIZON_TO_PERIOD[days]
+    st.caption(f"Periode data untuk {days} hari: **{periode} hari terakhir**")
+
+    # ─── Parameter & Seed ───
+    current_price = df["Close"].iloc[-1]
+    mu, sigma = hitung_parameter(df, periode)
+    seed      = hitung_seed(ticker_input, today_str, current_price)
+
+    # ─── Simulasi ───
+    # Seed ikut kunci: harga awal berbeda dalam hari yang sama tidak boleh berbagi hasil.
+    try:
+        tiket = penjadwal_simulasi().ajukan(
+            (ticker_input, today_str, days, seed),
+            perkiraan_memori_simulasi(days),
+            lambda: jalankan_simulasi(current_price, mu, sigma, days, seed + days),
+        )
+    except AntrianPenuh as e:
+        st.error(str(e))
+        st.stop()
+    finals = tunggu_simulasi(tiket, days)
+
+    # ─── Highlight peluang terbesar ───
+    probs_tmp, bins_tmp = distribusi_peluang(finals)
+    top_idx   = int(np.argmax(probs_tmp))
+    top_low   = bins_tmp[top_idx]
+    top_high  = bins_tmp[top_idx + 1]
+
+    st.success(
+        f"Peluang terbesar: **{pct(probs_tmp[top_idx])}** "
+        f"— kisaran US${fmt(top_low)} hingga US${fmt(top_high)}"
+    )
+
+    st.divider()
+
+    # ─── 1. Metric Cards ───
+    st.subheader(f"Proyeksi {ticker_input} — {days} Hari ke Depan")
+    st.caption(f"Parameter volatilitas dihitung dari {periode} hari terakhir · 100.000 simulasi")
+
+    statistik_tmp  = statistik_simulasi(finals)
+    harga_mean_tmp = statistik_tmp["harga_mean"]
+
+    render_metric_cards(
+        harga_mean_tmp, statistik_tmp["chance"], statistik_tmp["std_dev"], current_price
+    )
+
+    st.divider()
+
+    # ─── 2. Grafik Distribusi ───
+    st.markdown("**Grafik distribusi simulasi**")
+    st.caption(
+        "Distribusi 100.000 harga akhir simulasi. "
+        "Bar biru gelap = peluang tertinggi · "
+        "Garis biru = harga kini · Garis hijau = median geometrik."
+    )
+    render_grafik_distribusi(finals, current_price, harga_mean_tmp, days)
+
+    st.divider()
+
+    # ─── 3. Skenario Bull / Base / Bear ───
+    st.markdown("**Skenario Bull / Base / Bear**")
+    render_skenario(finals, current_price, days)
+
+    st.divider()
+
+    # ─── 4. Tabel Persentil ───
+    st.markdown("**Tabel persentil**")
+    render_tabel_persentil(finals, current_price)
+
+    st.divider()
+
+    # ─── Distribusi Peluang (tabel lengkap) ───
+    st.markdown("**Distribusi peluang**")
+    total_peluang, rentang_bawah, rentang_atas = render_tabel_distribusi(finals)
+
+    st.divider()
+
+    # ─── Statistik ───
+    st.markdown("**Statistik**")
+    render_tabel_statistik(finals)
+
+    st.divider()
+
+    # ─── 5. Ekspander Metodologi + Disclaimer ───
+    render_ekspander_metodologi(periode, days)
+
+    st.divider()
+
+    # ─── Teks Media Sosial & Unduhan ───
+    social_text = buat_teks_sosial(
+        ticker_input, days, current_price, total_peluang, rentang_bawah, rentang_atas
+    )
+    csv_data = buat_csv(finals, current_price, ticker_input, days)
+    npz_data = functools.partial(
+        buat_npz, finals, current_price, ticker_input, today_str,
+        seed + days, mu, sigma, periode, days,
+    )
+    fragmen_bagikan(social_text, csv_data, npz_data, ticker_input, days)
 
 # ════════════════════════════════════════════════
 # ANTARMUKA UTAMA
 # ════════════════════════════════════════════════
 
+# Rerun penuh hanya terjadi saat halaman dibuka atau ticker diganti;
+# interaksi lain ditangani fragmen di atas.
+mulai_halaman = time.perf_counter()
+
 # Header tanggal WIB
 wib = pytz.timezone("Asia/Jakarta")
 today_wib = datetime.now(wib)
@@ -624,18 +712,11 @@ with st.sidebar:
 
     ticker_input = st.selectbox("Pilih simbol kripto", TICKER_OPTIONS)
 
-    days = st.radio(
-        "Horizon proyeksi",
-        HORIZONS,
-        format_func=lambda x: f"{x} Hari",
-    )
-
     st.divider()
-    st.caption(
-        f"Periode data untuk {days} hari: "
-        f"**{HORIZON_TO_PERIOD[days]} hari terakhir**"
-    )
+    st.caption("Horizon proyeksi dipilih di halaman utama.")
     st.caption("Data: CoinGecko · Cache: 1 jam")
+    # Hanya diperbarui oleh rerun penuh; rerun fragmen tidak menyentuh sidebar.
+    slot_waktu = st.empty() if tampilkan_waktu() else None
 
 # ─── Ambil Data ───
 coin_id = COINGECKO_MAP[ticker_input]
@@ -658,108 +739,8 @@ st.write(
     f" _(simulasi dimulai dari harga terkini: US${fmt(current_price)})_"
 )
 
-# ─── Parameter & Seed ───
-periode = HORIZON_TO_PERIOD[days]
-mu, sigma = hitung_parameter(df, periode)
-
-today_str = today_wib.strftime("%Y-%m-%d")
-seed_str  = f"{ticker_input}-{today_str}-{round(current_price, 6)}"
-seed      = int(hashlib.md5(seed_str.encode()).hexdigest(), 16) % (2 ** 32)
-
-# ─── Simulasi ───
-with st.spinner(f"Menjalankan 100.000 simulasi untuk {days} hari…"):
-    finals = jalankan_simulasi(current_price, mu, sigma, days, seed + days)
-
-# ─── Highlight peluang terbesar ───
-bins_tmp  = np.linspace(finals.min(), finals.max(), 10)
-counts_tmp, _ = np.histogram(finals, bins=bins_tmp)
-probs_tmp = counts_tmp / len(finals) * 100
-top_idx   = int(np.argmax(probs_tmp))
-top_low   = bins_tmp[top_idx]
-top_high  = bins_tmp[top_idx + 1]
-
-st.success(
-    f"Peluang terbesar: **{pct(probs_tmp[top_idx])}** "
-    f"— kisaran US${fmt(top_low)} hingga US${fmt(top_high)}"
-)
-
-st.divider()
-
-# ─── 1. Metric Cards ───
-st.subheader(f"Proyeksi {ticker_input} — {days} Hari ke Depan")
-st.caption(f"Parameter volatilitas dihitung dari {periode} hari terakhir · 100.000 simulasi")
-
-harga_mean_tmp = float(np.exp(np.mean(np.log(finals))))
-chance_tmp     = float(np.mean(finals > harga_mean_tmp) * 100)
-std_tmp        = float(np.std(finals))
-
-render_metric_cards(harga_mean_tmp, chance_tmp, std_tmp, current_price)
-
-st.divider()
-
-# ─── 2. Grafik Distribusi ───
-st.markdown("**Grafik distribusi simulasi**")
-st.caption(
-    "Distribusi 100.000 harga akhir simulasi. "
-    "Bar biru gelap = peluang tertinggi · "
-    "Garis biru = harga kini · Garis hijau = median geometrik."
-)
-render_grafik_distribusi(finals, current_price, harga_mean_tmp, days)
-
-st.divider()
-
-# ─── 3. Skenario Bull / Base / Bear ───
-st.markdown("**Skenario Bull / Base / Bear**")
-render_skenario(finals, current_price, days)
+fragmen_proyeksi(ticker_input, df, today_wib.strftime("%Y-%m-%d"))
 
-st.divider()
-
-# ─── 4. Tabel Persentil ───
-st.markdown("**Tabel persentil**")
-render_tabel_persentil(finals, current_price)
-
-st.divider()
-
-# ─── Distribusi Peluang (tabel lengkap) ───
-st.markdown("**Distribusi peluang**")
-total_peluang, rentang_bawah, rentang_atas = render_tabel_distribusi(finals)
-
-st.divider()
-
-# ─── Statistik ───
-st.markdown("**Statistik**")
-harga_mean, chance = render_tabel_statistik(finals)
-
-st.divider()
-
-# ─── 5. Ekspander Metodologi + Disclaimer ───
-render_ekspander_metodologi(periode, days)
-
-st.divider()
-
-# ─── Teks Media Sosial ───
-chg_low_txt,  _  = pct_chg(rentang_bawah, current_price)
-chg_high_txt, _  = pct_chg(rentang_atas,  current_price)
-
-social_text = (
-    f"Simulasi Monte Carlo menunjukkan peluang {pct(total_peluang)} "
-    f"bagi {ticker_input} bergerak antara US${fmt(rentang_bawah)} "
-    f"hingga US${fmt(rentang_atas)} dalam {days} hari ke depan, "
-    f"dengan potensi {chg_low_txt} hingga {chg_high_txt} dari harga saat ini."
-)
-
-st.text_area(
-    label="Teks untuk media sosial",
-    value=social_text,
-    height=90,
-    key=f"social_{ticker_input}_{days}",
-)
-
-# ─── Download CSV ───
-csv_data = buat_csv(finals, current_price, ticker_input, days)
-st.download_button(
-    label="⬇️ Unduh hasil sebagai CSV",
-    data=csv_data,
-    file_name=f"monte_carlo_{ticker_input}_{days}hari.csv",
-    mime="text/csv",
-)
+ms_halaman = catat_waktu("halaman", mulai_halaman)
+if slot_waktu is not None:
+    slot_waktu.caption(f"⏱️ Rerun halaman penuh: {ms_halaman:.0f} ms")
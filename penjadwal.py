@@ -0,0 +1,183 @@
+"""
+Penjadwal simulasi tingkat proses: membatasi memori & jumlah simulasi yang
+berjalan bersamaan di seluruh sesi Streamlit.
+
+Konfigurasi lewat environment variable:
+    MC_ANGGARAN_MEMORI_MB  anggaran memori simulasi aktif (default 1024)
+    MC_MAKS_SIMULASI       simulasi paralel maksimum      (default 2)
+    MC_MAKS_ANTRIAN        panjang antrian maksimum       (default 50)
+"""
+from __future__ import annotations
+
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Hashable, Optional
+
+
+class AntrianPenuh(RuntimeError):
+    """Antrian simulasi sudah mencapai batas; permintaan ditolak."""
+
+
+class TiketSimulasi:
+    """
+    Pegangan satu pekerjaan di penjadwal. Dibagi oleh pengaju yang identik;
+    setiap pengaju wajib memanggil lepas() setelah selesai menunggu.
+    """
+
+    def __init__(
+        self,
+        penjadwal: "PenjadwalSimulasi",
+        kunci: Hashable,
+        kebutuhan_byte: int,
+        fungsi: Callable[[], Any],
+    ) -> None:
+        self.kunci = kunci
+        self.kebutuhan_byte = kebutuhan_byte
+        self._penjadwal = penjadwal
+        self._fungsi = fungsi
+        self._future: Future = Future()
+        self._penunggu = 0
+
+    def posisi(self) -> int:
+        """Posisi di antrian (1 = berikutnya), 0 jika sedang/selesai berjalan."""
+        return self._penjadwal._posisi(self)
+
+    def selesai(self) -> bool:
+        return self._future.done()
+
+    def tunggu(self, timeout: Optional[float] = None) -> bool:
+        """Tunggu hingga selesai atau timeout. Returns selesai()."""
+        wait([self._future], timeout=timeout)
+        return self._future.done()
+
+    def hasil(self, timeout: Optional[float] = None) -> Any:
+        return self._future.result(timeout=timeout)
+
+    def lepas(self) -> None:
+        """
+        Satu pengaju berhenti menunggu. Bila tidak ada lagi yang menunggu dan
+        pekerjaan masih antre, pekerjaan dibuang dari antrian dan dibatalkan.
+        """
+        self._penjadwal._lepas(self)
+
+
+class PenjadwalSimulasi:
+    """
+    Antrian FIFO dengan kontrol admisi berdasarkan anggaran memori dan
+    jumlah simulasi paralel. Pekerjaan hanya dimulai dari kepala antrian,
+    sehingga simulasi besar tidak disalip terus-menerus oleh yang kecil.
+    Pekerjaan dengan kunci yang sedang antre/berjalan digabung (dedup).
+    Pekerjaan antre yang sudah tidak ditunggu siapa pun dibatalkan.
+    """
+
+    def __init__(
+        self,
+        anggaran_byte: int,
+        maks_paralel: int = 2,
+        maks_antrian: int = 50,
+    ) -> None:
+        self.anggaran_byte = anggaran_byte
+        self.maks_paralel = maks_paralel
+        self.maks_antrian = maks_antrian
+        self._antrian: Deque[TiketSimulasi] = deque()
+        self._aktif: Dict[Hashable, TiketSimulasi] = {}
+        self._terpakai = 0
+        self._berjalan = 0
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(
+            max_workers=maks_paralel, thread_name_prefix="simulasi"
+        )
+
+    @classmethod
+    def dari_env(cls) -> "PenjadwalSimulasi":
+        return cls(
+            anggaran_byte=int(os.environ.get("MC_ANGGARAN_MEMORI_MB", "1024")) * 2 ** 20,
+            maks_paralel=int(os.environ.get("MC_MAKS_SIMULASI", "2")),
+            maks_antrian=int(os.environ.get("MC_MAKS_ANTRIAN", "50")),
+        )
+
+    def ajukan(
+        self,
+        kunci: Hashable,
+        kebutuhan_byte: int,
+        fungsi: Callable[[], Any],
+    ) -> TiketSimulasi:
+        """
+        Masukkan pekerjaan ke antrian, atau kembalikan tiket yang sudah ada
+        bila pekerjaan dengan kunci sama sedang antre/berjalan. Pemanggil
+        terhitung sebagai penunggu sampai memanggil tiket.lepas().
+        """
+        with self._lock:
+            tiket = self._aktif.get(kunci)
+            if tiket is not None:
+                tiket._penunggu += 1
+                return tiket
+            if len(self._antrian) >= self.maks_antrian:
+                raise AntrianPenuh(
+                    "Server sedang sibuk: antrian simulasi penuh. "
+                    "Coba lagi beberapa saat."
+                )
+            tiket = TiketSimulasi(self, kunci, kebutuhan_byte, fungsi)
+            tiket._penunggu = 1
+            self._aktif[kunci] = tiket
+            self._antrian.append(tiket)
+            self._jadwalkan()
+        return tiket
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "antrian":       len(self._antrian),
+                "berjalan":      self._berjalan,
+                "memori_byte":   self._terpakai,
+                "anggaran_byte": self.anggaran_byte,
+            }
+
+    def _posisi(self, tiket: TiketSimulasi) -> int:
+        with self._lock:
+            for i, t in enumerate(self._antrian):
+                if t is tiket:
+                    return i + 1
+        return 0
+
+    def _lepas(self, tiket: TiketSimulasi) -> None:
+        with self._lock:
+            if tiket._penunggu > 0:
+                tiket._penunggu -= 1
+            if tiket._penunggu > 0 or tiket not in self._antrian:
+                return
+            # Belum berjalan dan tidak ditunggu lagi: jangan buang anggaran.
+            self._antrian.remove(tiket)
+            del self._aktif[tiket.kunci]
+            tiket._future.cancel()
+            # Kepala antrian bisa berubah sehingga pekerjaan lain kini muat.
+            self._jadwalkan()
+
+    def _jadwalkan(self) -> None:
+        # Dipanggil dengan self._lock dipegang.
+        while self._antrian and self._berjalan < self.maks_paralel:
+            kepala = self._antrian[0]
+            # Pekerjaan yang melebihi seluruh anggaran tetap boleh jalan
+            # sendirian agar tidak macet selamanya.
+            muat = self._terpakai + kepala.kebutuhan_byte <= self.anggaran_byte
+            if not muat and self._berjalan > 0:
+                break
+            self._antrian.popleft()
+            self._terpakai += kepala.kebutuhan_byte
+            self._berjalan += 1
+            self._pool.submit(self._jalankan, kepala)
+
+    def _jalankan(self, tiket: TiketSimulasi) -> None:
+        try:
+            if tiket._future.set_running_or_notify_cancel():
+                tiket._future.set_result(tiket._fungsi())
+        except BaseException as e:
+            tiket._future.set_exception(e)
+        finally:
+            with self._lock:
+                self._terpakai -= tiket.kebutuhan_byte
+                self._berjalan -= 1
+                del self._aktif[tiket.kunci]
+                self._jadwalkan()
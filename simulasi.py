@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from typing import Tuple
+import requests
+
+# ════════════════════════════════════════════════
+# KONSTANTA
+# ════════════════════════════════════════════════
+
+HORIZON_TO_PERIOD: dict = {
+    3:   60,
+    7:   60,
+    30:  180,
+    90:  365,
+    365: 365,
+}
+
+HORIZONS = [3, 7, 30, 90, 365]
+MAX_PERIOD = max(HORIZON_TO_PERIOD.values())
+
+# Bisa diarahkan ke server tiruan (mis. uji_beban_app.py) lewat environment.
+COINGECKO_API_URL = "https://api.coingecko.com/api/v3"
+
+JUMLAH_SIMULASI = 100_000
+PERSENTIL = [10, 25, 50, 75, 90]
+
+COINGECKO_MAP = {
+    "BTC-USD": "bitcoin",          "ETH-USD": "ethereum",         "BNB-USD": "binancecoin",
+    "USDT-USD": "tether",          "SOL-USD": "solana",            "XRP-USD": "ripple",
+    "TON-USD": "toncoin",          "DOGE-USD": "dogecoin",         "ADA-USD": "cardano",
+    "AVAX-USD": "avalanche-2",     "SHIB-USD": "shiba-inu",        "WETH-USD": "weth",
+    "DOT-USD": "polkadot",         "TRX-USD": "tron",              "WBTC-USD": "wrapped-bitcoin",
+    "LINK-USD": "chainlink",       "MATIC-USD": "matic-network",   "ICP-USD": "internet-computer",
+    "LTC-USD": "litecoin",         "BCH-USD": "bitcoin-cash",      "NEAR-USD": "near",
+    "UNI-USD": "uniswap",          "PEPE-USD": "pepe",             "LEO-USD": "leo-token",
+    "DAI-USD": "dai",              "APT-USD": "aptos",             "STETH-USD": "staked-ether",
+    "XLM-USD": "stellar",          "OKB-USD": "okb",               "ETC-USD": "ethereum-classic",
+    "CRO-USD": "crypto-com-chain", "FIL-USD": "filecoin",          "RNDR-USD": "render-token",
+    "ATOM-USD": "cosmos",          "HBAR-USD": "hedera-hashgraph", "KAS-USD": "kaspa",
+    "IMX-USD": "immutable-x",      "TAO-USD": "bittensor",         "VET-USD": "vechain",
+    "MNT-USD": "mantle",           "FET-USD": "fetch-ai",          "LDO-USD": "lido-dao",
+    "TONCOIN-USD": "toncoin",      "AR-USD": "arweave",            "INJ-USD": "injective-protocol",
+    "GRT-USD": "the-graph",        "BTCB-USD": "bitcoin-bep2",     "USDC-USD": "usd-coin",
+    "SUI-USD": "sui",              "BGB-USD": "bitget-token",      "XTZ-USD": "tezos",
+    "MUBARAK-USD": "mubarakcoin",
+}
+
+TICKER_OPTIONS = sorted(COINGECKO_MAP.keys())
+
+# ════════════════════════════════════════════════
+# UTILITAS FORMAT
+# ════════════════════════════════════════════════
+
+def fmt(val) -> str:
+    """Format angka ke format Indonesia (titik=ribuan, koma=desimal)."""
+    try:
+        val = float(val)
+    except (TypeError, ValueError):
+        return str(val)
+    if abs(val) < 1:
+        s = f"{val:,.8f}"
+    else:
+        s = f"{val:,.0f}"
+    return s.replace(",", "X").replace(".", ",").replace("X", ".")
+
+
+def pct(val) -> str:
+    """Format persen ke format Indonesia."""
+    try:
+        val = float(val)
+    except (TypeError, ValueError):
+        return str(val)
+    return f"{val:.1f}".replace(".", ",") + "%"
+
+
+def pct_chg(val: float, base: float) -> Tuple[str, bool]:
+    """
+    Hitung persentase perubahan dari base.
+    Returns (teks_format, is_up).
+    """
+    p = (val - base) / base * 100
+    is_up = p >= 0
+    arah = "naik" if is_up else "turun"
+    return f"{arah} {abs(p):.1f}%".replace(".", ","), is_up
+
+# ════════════════════════════════════════════════
+# DATA
+# ════════════════════════════════════════════════
+
+def unduh_data_harga(coin_id: str) -> pd.DataFrame:
+    """
+    Unduh data harga historis harian dari CoinGecko (tanpa cache).
+    Satu panggilan untuk semua horizon.
+    """
+    base_url = os.environ.get("COINGECKO_API_URL", COINGECKO_API_URL)
+    url = f"{base_url}/coins/{coin_id}/market_chart"
+    params = {"vs_currency": "usd", "days": str(MAX_PERIOD)}
+
+    try:
+        resp = requests.get(url, params=params, timeout=15)
+        resp.raise_for_status()
+    except requests.exceptions.Timeout:
+        raise ConnectionError(
+            "Permintaan ke CoinGecko habis waktu (timeout). Coba lagi beberapa saat."
+        )
+    except requests.exceptions.HTTPError as e:
+        status = e.response.status_code if e.response is not None else "?"
+        if status == 429:
+            raise ConnectionError(
+                "Batas permintaan API CoinGecko terlampaui (429). "
+                "Tunggu beberapa menit lalu coba lagi."
+            )
+        raise ConnectionError(
+            f"API CoinGecko mengembalikan error HTTP {status}. "
+            "Periksa koneksi internet atau coba lagi."
+        )
+    except requests.exceptions.ConnectionError:
+        raise ConnectionError(
+            "Tidak dapat terhubung ke CoinGecko. Periksa koneksi internet Anda."
+        )
+
+    prices = resp.json().get("prices", [])
+    if len(prices) < 60:
+        raise ValueError(
+            "Data historis tidak mencukupi (minimal 60 hari). Coba pilih koin lain."
+        )
+
+    dates  = [datetime.fromtimestamp(p[0] / 1000).date() for p in prices]
+    closes = [p[1] for p in prices]
+    return pd.DataFrame({"Date": dates, "Close": closes}).set_index("Date")
+
+
+def hitung_parameter(df: pd.DataFrame, periode: int) -> Tuple[float, float]:
+    """Hitung mu & sigma log-return dari N hari terakhir."""
+    n_slice = min(periode + 1, len(df))
+    df_slice = df.iloc[-n_slice:]
+    log_ret = np.log(df_slice["Close"] / df_slice["Close"].shift(1)).dropna()
+    return float(log_ret.mean()), float(log_ret.std())
+
+
+def hitung_seed(ticker: str, today_str: str, current_price: float) -> int:
+    """Seed deterministik dari ticker, tanggal WIB, dan harga terkini."""
+    seed_str = f"{ticker}-{today_str}-{round(current_price, 6)}"
+    return int(hashlib.md5(seed_str.encode()).hexdigest(), 16) % (2 ** 32)
+
+
+def jalankan_simulasi(
+    current_price: float,
+    mu: float,
+    sigma: float,
+    days: int,
+    seed: int,
+) -> np.ndarray:
+    """Monte Carlo GBM, vektorisasi penuh (100.000 jalur)."""
+    rng = np.random.default_rng(seed)
+    log_returns = rng.normal(mu, sigma, size=(days, JUMLAH_SIMULASI))
+    return current_price * np.exp(np.sum(log_returns, axis=0))
+
+
+def perkiraan_memori_simulasi(days: int) -> int:
+    """
+    Perkiraan puncak memori (byte) satu panggilan jalankan_simulasi:
+    matriks log-return (days × jalur) plus tiga vektor antara float64.
+    """
+    return (days + 3) * JUMLAH_SIMULASI * np.dtype(np.float64).itemsize
+
+# ════════════════════════════════════════════════
+# RINGKASAN HASIL
+# ════════════════════════════════════════════════
+
+def distribusi_peluang(finals: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Histogram 9 rentang harga. Returns (peluang_persen, tepi_bin)."""
+    bins = np.linspace(finals.min(), finals.max(), 10)
+    counts, _ = np.histogram(finals, bins=bins)
+    return counts / len(finals) * 100, bins
+
+
+def rentang_teratas(
+    probs: np.ndarray,
+    bins: np.ndarray,
+    n: int = 3,
+) -> Tuple[float, float, float]:
+    """
+    Gabungkan n rentang dengan peluang tertinggi (yang peluangnya > 0).
+    Returns (total_peluang, rentang_bawah, rentang_atas).
+    """
+    total_peluang = 0.0
+    rentang_bawah = float("inf")
+    rentang_atas  = 0.0
+    for id_sort in np.argsort(probs)[::-1][:n]:
+        if probs[id_sort] == 0:
+            continue
+        total_peluang += probs[id_sort]
+        rentang_bawah  = min(rentang_bawah, bins[id_sort])
+        rentang_atas   = max(rentang_atas, bins[id_sort + 1])
+    return float(total_peluang), float(rentang_bawah), float(rentang_atas)
+
+
+def statistik_simulasi(finals: np.ndarray) -> dict:
+    """Statistik ringkasan harga akhir simulasi."""
+    mean_log   = float(np.mean(np.log(finals)))
+    harga_mean = float(np.exp(mean_log))
+    return {
+        "mean_log":   mean_log,
+        "harga_mean": harga_mean,
+        "chance":     float(np.mean(finals > harga_mean) * 100),
+        "std_dev":    float(np.std(finals)),
+        "skewness":   float(pd.Series(finals).skew()),
+    }
+
+
+def buat_teks_sosial(
+    ticker: str,
+    days: int,
+    current_price: float,
+    total_peluang: float,
+    rentang_bawah: float,
+    rentang_atas: float,
+) -> str:
+    """Kalimat ringkas proyeksi untuk dibagikan di media sosial."""
+    chg_low_txt,  _  = pct_chg(rentang_bawah, current_price)
+    chg_high_txt, _  = pct_chg(rentang_atas,  current_price)
+    return (
+        f"Simulasi Monte Carlo menunjukkan peluang {pct(total_peluang)} "
+        f"bagi {ticker} bergerak antara US${fmt(rentang_bawah)} "
+        f"hingga US${fmt(rentang_atas)} dalam {days} hari ke depan, "
+        f"dengan potensi {chg_low_txt} hingga {chg_high_txt} dari harga saat ini."
+    )
+
+
+def ringkasan_proyeksi(
+    df: pd.DataFrame,
+    ticker: str,
+    days: int,
+    today_str: str,
+) -> dict:
+    """
+    Jalankan proyeksi lengkap untuk satu ticker & horizon dan kembalikan
+    hasilnya sebagai dict yang siap diserialisasi ke JSON.
+    """
+    current_price = float(df["Close"].iloc[-1])
+    periode = HORIZON_TO_PERIOD[days]
+    mu, sigma = hitung_parameter(df, periode)
+    # Seed RNG yang benar-benar dipakai (sama dengan yang disimpan di .npz).
+    seed = hitung_seed(ticker, today_str, current_price) + days
+
+    finals = jalankan_simulasi(current_price, mu, sigma, days, seed)
+
+    probs, bins = distribusi_peluang(finals)
+    total_peluang, rentang_bawah, rentang_atas = rentang_teratas(probs, bins)
+    statistik = statistik_simulasi(finals)
+
+    return {
+        "ticker":        ticker,
+        "days":          days,
+        "periode":       periode,
+        "tanggal":       today_str,
+        "harga_kini":    current_price,
+        "mu":            mu,
+        "sigma":         sigma,
+        "seed":          seed,
+        "persentil": {
+            f"P{p}": float(v)
+            for p, v in zip(PERSENTIL, np.percentile(finals, PERSENTIL))
+        },
+        "distribusi": [
+            {"peluang": float(probs[i]), "bawah": float(bins[i]), "atas": float(bins[i + 1])}
+            for i in range(len(probs))
+        ],
+        "statistik": statistik,
+        "teks_sosial": buat_teks_sosial(
+            ticker, days, current_price, total_peluang, rentang_bawah, rentang_atas
+        ),
+    }
+
+# ════════════════════════════════════════════════
+# EKSPOR CSV & NPZ
+# ════════════════════════════════════════════════
+
+def buat_csv(
+    finals: np.ndarray,
+    current_price: float,
+    ticker: str,
+    days: int,
+) -> str:
+    """Buat string CSV dari persentil dan distribusi peluang."""
+    persentil = np.array(PERSENTIL)
+    vals  = np.percentile(finals, persentil)
+    chg   = (vals - current_price) / current_price * 100
+    probs, bins = distribusi_peluang(finals)
+
+    buf = io.StringIO()
+    buf.write(f"Proyeksi Monte Carlo — {ticker} — {days} hari\n\n")
+    buf.write("Persentil,Harga (USD),Perubahan (%)\n")
+    np.savetxt(
+        buf, np.column_stack([persentil, vals, chg]),
+        fmt=["P%d", "%.2f", "%.2f%%"], delimiter=",",
+    )
+    buf.write("\nPeluang (%),Rentang Bawah (USD),Rentang Atas (USD)\n")
+    np.savetxt(
+        buf, np.column_stack([probs, bins[:-1], bins[1:]]),
+        fmt=["%.2f%%", "%.2f", "%.2f"], delimiter=",",
+    )
+    return buf.getvalue().rstrip("\n")
+
+
+def buat_npz(
+    finals: np.ndarray,
+    current_price: float,
+    ticker: str,
+    tanggal: str,
+    seed: int,
+    mu: float,
+    sigma: float,
+    periode: int,
+    days: int,
+) -> bytes:
+    """
+    Arsip .npz berisi seluruh harga akhir simulasi (`finals`, float64) beserta
+    parameternya. Array ditulis langsung dari buffer-nya, tanpa konversi teks.
+    `seed` adalah seed RNG yang benar-benar dipakai jalankan_simulasi.
+    Baca dengan np.load(path) — tidak memerlukan allow_pickle.
+    """
+    buf = io.BytesIO()
+    np.savez(
+        buf,
+        finals=finals,
+        ticker=np.array(ticker),
+        tanggal=np.array(tanggal),
+        seed=np.int64(seed),
+        mu=np.float64(mu),
+        sigma=np.float64(sigma),
+        periode=np.int64(periode),
+        days=np.int64(days),
+        harga_kini=np.float64(current_price),
+    )
+    return buf.getvalue()
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import Future
+
+import pandas as pd
+import pytest
+
+import api
+from api import CacheTTL, HandlerProyeksi, LayananProyeksi, ServerPool, SingleFlight
+
+TIMEOUT = 5
+
+
+def tunggu_sampai(kondisi) -> None:
+    batas = time.monotonic() + TIMEOUT
+    while not kondisi():
+        assert time.monotonic() < batas, "kondisi tidak terpenuhi"
+        time.sleep(0.001)
+
+
+@pytest.fixture
+def menunggu(monkeypatch) -> threading.Semaphore:
+    """Dilepas setiap kali pemanggil SingleFlight mulai menunggu hasil."""
+    sem = threading.Semaphore(0)
+
+    class FutureTercatat(Future):
+        def result(self, timeout=None):
+            sem.release()
+            return super().result(timeout)
+
+    monkeypatch.setattr(api, "Future", FutureTercatat)
+    return sem
+
+
+def test_singleflight_satu_eksekusi_untuk_banyak_pemanggil(menunggu):
+    sf = SingleFlight()
+    mulai, boleh_selesai = threading.Event(), threading.Event()
+    panggilan: list = []
+
+    def fungsi() -> str:
+        panggilan.append(1)
+        mulai.set()
+        assert boleh_selesai.wait(TIMEOUT)
+        return "hasil"
+
+    hasil: list = []
+    pemimpin = threading.Thread(target=lambda: hasil.append(sf.lakukan("k", fungsi)))
+    pemimpin.start()
+    assert mulai.wait(TIMEOUT)
+
+    pengikut = [
+        threading.Thread(target=lambda: hasil.append(sf.lakukan("k", fungsi)))
+        for _ in range(7)
+    ]
+    for t in pengikut:
+        t.start()
+    # Semua pengikut harus sudah menunggu sebelum pemimpin dilepas.
+    for _ in pengikut:
+        assert menunggu.acquire(timeout=TIMEOUT)
+    boleh_selesai.set()
+    for t in [pemimpin] + pengikut:
+        t.join(TIMEOUT)
+
+    assert len(panggilan) == 1
+    assert hasil == ["hasil"] * 8
+    assert sf._berjalan == {}
+
+
+def test_singleflight_error_dibagi_ke_semua_pemanggil(menunggu):
+    sf = SingleFlight()
+    mulai, boleh_selesai = threading.Event(), threading.Event()
+    panggilan: list = []
+
+    def gagal() -> None:
+        panggilan.append(1)
+        mulai.set()
+        assert boleh_selesai.wait(TIMEOUT)
+        raise ConnectionError("CoinGecko mati")
+
+    error: list = []
+
+    def panggil() -> None:
+        try:
+            sf.lakukan("k", gagal)
+        except ConnectionError as e:
+            error.append(e)
+
+    threads = [threading.Thread(target=panggil) for _ in range(4)]
+    threads[0].start()
+    assert mulai.wait(TIMEOUT)
+    for t in threads[1:]:
+        t.start()
+    for _ in threads[1:]:
+        assert menunggu.acquire(timeout=TIMEOUT)
+    boleh_selesai.set()
+    for t in threads:
+        t.join(TIMEOUT)
+
+    assert len(panggilan) == 1
+    assert len(error) == 4 and len({id(e) for e in error}) == 1
+    # Kunci dilepas: pemanggilan berikutnya menjalankan fungsi lagi.
+    assert sf.lakukan("k", lambda: "pulih") == "pulih"
+
+
+def test_pemimpin_cek_ulang_cache(monkeypatch):
+    layanan = LayananProyeksi(ttl=60)
+    df = pd.DataFrame({"Close": [1.0, 2.0]})
+    unduhan: list = []
+    monkeypatch.setattr(api, "unduh_data_harga", lambda coin_id: unduhan.append(coin_id))
+
+    # Pemimpin sebelumnya menyimpan data tepat setelah cek cache pertama
+    # pemanggil ini; cek pertama melihat cache kosong, cek kedua tidak.
+    layanan._cache_data.simpan("bitcoin", df)
+    ambil_asli = layanan._cache_data.ambil
+    cek: list = []
+
+    def ambil(kunci):
+        cek.append(kunci)
+        return (False, None) if len(cek) == 1 else ambil_asli(kunci)
+
+    monkeypatch.setattr(layanan._cache_data, "ambil", ambil)
+
+    assert layanan._data_harga("bitcoin") is df
+    assert len(cek) == 2
+    assert unduhan == []
+
+
+def test_simpan_menyapu_entri_kedaluwarsa():
+    cache = CacheTTL(ttl=0)
+    cache.simpan("kemarin", 1)
+    cache.simpan("lusa", 2)
+
+    cache.ttl = 60
+    cache.simpan("hari-ini", 3)
+
+    assert list(cache._data) == ["hari-ini"]
+    assert cache.ambil("hari-ini") == (True, 3)
+    assert cache.ambil("kemarin") == (False, None)
+
+
+class LayananLambat:
+    """Layanan tiruan yang menahan worker sampai dilepas."""
+
+    def __init__(self) -> None:
+        self.masuk = threading.Semaphore(0)
+        self.boleh_selesai = threading.Event()
+
+    def proyeksi(self, ticker: str, days: int) -> dict:
+        self.masuk.release()
+        assert self.boleh_selesai.wait(TIMEOUT)
+        return {"ticker": ticker, "days": days}
+
+
+@pytest.fixture
+def server_penuh():
+    """ServerPool dengan 1 worker + 1 antrian yang keduanya sedang terpakai."""
+    layanan = LayananLambat()
+    server = ServerPool(("127.0.0.1", 0), HandlerProyeksi, 1, 1, layanan)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = (f"http://127.0.0.1:{server.server_address[1]}"
+           "/proyeksi?ticker=BTC-USD&days=30")
+
+    status: list = []
+
+    def klien() -> None:
+        with urllib.request.urlopen(url, timeout=TIMEOUT) as r:
+            status.append(r.status)
+
+    diterima = [threading.Thread(target=klien) for _ in range(2)]
+    diterima[0].start()
+    assert layanan.masuk.acquire(timeout=TIMEOUT)
+    diterima[1].start()
+    # Permintaan kedua memegang slot antrian sampai worker bebas.
+    tunggu_sampai(lambda: server._slot._value == 0)
+
+    yield url
+    layanan.boleh_selesai.set()
+    for t in diterima:
+        t.join(TIMEOUT)
+    server.shutdown()
+    server.server_close()
+    assert status == [200, 200]
+
+
+def test_503_saat_worker_dan_antrian_habis(server_penuh):
+    for _ in range(5):
+        with pytest.raises(urllib.error.HTTPError) as info:
+            urllib.request.urlopen(server_penuh, timeout=TIMEOUT)
+        assert info.value.code == 503
+        assert "sibuk" in json.loads(info.value.read())["error"]
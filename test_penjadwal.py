@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import CancelledError
+
+import pytest
+
+from penjadwal import AntrianPenuh, PenjadwalSimulasi
+
+TIMEOUT = 5
+
+
+class Pekerjaan:
+    """Pekerjaan tiruan yang mencatat urutan mulai dan menunggu dilepas."""
+
+    def __init__(self, log: list, nama: str) -> None:
+        self.log = log
+        self.nama = nama
+        self.mulai = threading.Event()
+        self.boleh_selesai = threading.Event()
+
+    def __call__(self) -> str:
+        self.log.append(self.nama)
+        self.mulai.set()
+        assert self.boleh_selesai.wait(TIMEOUT)
+        return self.nama
+
+
+def test_fifo_dan_anggaran_memori():
+    p = PenjadwalSimulasi(anggaran_byte=100, maks_paralel=2)
+    log: list = []
+    a, b, c = (Pekerjaan(log, n) for n in "abc")
+
+    ta = p.ajukan("a", 60, a)
+    tb = p.ajukan("b", 60, b)
+    tc = p.ajukan("c", 10, c)
+
+    assert a.mulai.wait(TIMEOUT)
+    # b tidak muat di anggaran; c yang muat tidak boleh menyalip b.
+    assert (tb.posisi(), tc.posisi()) == (1, 2)
+    assert p.status()["memori_byte"] == 60
+
+    a.boleh_selesai.set()
+    assert b.mulai.wait(TIMEOUT) and c.mulai.wait(TIMEOUT)
+    b.boleh_selesai.set()
+    c.boleh_selesai.set()
+
+    assert [t.hasil(TIMEOUT) for t in (ta, tb, tc)] == ["a", "b", "c"]
+    assert log == ["a", "b", "c"]
+    assert p.status() == {
+        "antrian": 0, "berjalan": 0, "memori_byte": 0, "anggaran_byte": 100,
+    }
+
+
+def test_pekerjaan_melebihi_anggaran_jalan_sendirian():
+    p = PenjadwalSimulasi(anggaran_byte=100, maks_paralel=2)
+    log: list = []
+    besar, kecil = Pekerjaan(log, "besar"), Pekerjaan(log, "kecil")
+
+    tb = p.ajukan("besar", 500, besar)
+    tk = p.ajukan("kecil", 1, kecil)
+
+    assert besar.mulai.wait(TIMEOUT)
+    assert tk.posisi() == 1
+    besar.boleh_selesai.set()
+    kecil.boleh_selesai.set()
+    assert tb.hasil(TIMEOUT) == "besar" and tk.hasil(TIMEOUT) == "kecil"
+
+
+def test_dedup_kunci_sama():
+    p = PenjadwalSimulasi(anggaran_byte=100, maks_paralel=1)
+    log: list = []
+    asli, duplikat = Pekerjaan(log, "asli"), Pekerjaan(log, "duplikat")
+
+    t1 = p.ajukan("k", 10, asli)
+    t2 = p.ajukan("k", 10, duplikat)
+
+    assert t1 is t2
+    asli.boleh_selesai.set()
+    assert t2.hasil(TIMEOUT) == "asli"
+    assert log == ["asli"]
+
+
+def test_pekerjaan_antre_yang_ditinggalkan_dibatalkan():
+    p = PenjadwalSimulasi(anggaran_byte=100, maks_paralel=1, maks_antrian=1)
+    log: list = []
+    a, b, c = (Pekerjaan(log, n) for n in "abc")
+
+    ta = p.ajukan("a", 10, a)
+    assert a.mulai.wait(TIMEOUT)
+    tb = p.ajukan("b", 10, b)
+    with pytest.raises(AntrianPenuh):
+        p.ajukan("c", 10, c)
+
+    tb.lepas()
+
+    with pytest.raises(CancelledError):
+        tb.hasil(TIMEOUT)
+    # Slot antrian kosong lagi: pengaju lain tidak lagi ditolak.
+    tc = p.ajukan("c", 10, c)
+    a.boleh_selesai.set()
+    c.boleh_selesai.set()
+    assert ta.hasil(TIMEOUT) == "a" and tc.hasil(TIMEOUT) == "c"
+    assert log == ["a", "c"]
+
+
+def test_pekerjaan_tetap_jalan_selama_masih_ada_penunggu():
+    p = PenjadwalSimulasi(anggaran_byte=100, maks_paralel=1)
+    log: list = []
+    a, b = Pekerjaan(log, "a"), Pekerjaan(log, "b")
+
+    p.ajukan("a", 10, a)
+    assert a.mulai.wait(TIMEOUT)
+    tb = p.ajukan("b", 10, b)
+    assert p.ajukan("b", 10, b) is tb
+
+    tb.lepas()
+    assert tb.posisi() == 1
+
+    a.boleh_selesai.set()
+    b.boleh_selesai.set()
+    assert tb.hasil(TIMEOUT) == "b"
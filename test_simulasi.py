@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import io
+
+import numpy as np
+import pytest
+
+from simulasi import buat_csv, buat_npz
+
+
+def buat_csv_lama(
+    finals: np.ndarray,
+    current_price: float,
+    ticker: str,
+    days: int,
+) -> str:
+    """Implementasi baris-per-baris sebelum vektorisasi, sebagai acuan."""
+    lines = [f"Proyeksi Monte Carlo — {ticker} — {days} hari\n"]
+
+    lines.append("Persentil,Harga (USD),Perubahan (%)")
+    for p in [10, 25, 50, 75, 90]:
+        val = float(np.percentile(finals, p))
+        chg = (val - current_price) / current_price * 100
+        lines.append(f"P{p},{val:.2f},{chg:.2f}%")
+
+    lines.append("\nPeluang (%),Rentang Bawah (USD),Rentang Atas (USD)")
+    bins = np.linspace(finals.min(), finals.max(), 10)
+    counts, _ = np.histogram(finals, bins=bins)
+    probs = counts / len(finals) * 100
+    for i, p in enumerate(probs):
+        lines.append(f"{p:.2f}%,{bins[i]:.2f},{bins[i+1]:.2f}")
+
+    return "\n".join(lines)
+
+
+@pytest.mark.parametrize("harga_kini, skala", [
+    (65_000.0, 0.4),      # BTC: harga besar
+    (0.00001234, 0.8),    # PEPE: harga sangat kecil, perubahan besar
+    (1.0, 0.001),         # stablecoin: nyaris tanpa volatilitas
+])
+def test_buat_csv_sama_dengan_implementasi_lama(harga_kini, skala):
+    rng = np.random.default_rng(7)
+    finals = harga_kini * np.exp(rng.normal(0.0, skala, 100_000))
+
+    assert (buat_csv(finals, harga_kini, "BTC-USD", 30)
+            == buat_csv_lama(finals, harga_kini, "BTC-USD", 30))
+
+
+def test_buat_npz_bolak_balik_tanpa_pickle():
+    finals = np.random.default_rng(3).lognormal(10.0, 0.3, 100_000)
+    metadata = {
+        "ticker":     "BTC-USD",
+        "tanggal":    "2026-10-19",
+        "seed":       2 ** 32 + 29,     # seed + days bisa melewati 2**32
+        "mu":         0.0012,
+        "sigma":      0.034,
+        "periode":    180,
+        "days":       30,
+        "harga_kini": 65_000.5,
+    }
+
+    data = buat_npz(
+        finals, metadata["harga_kini"], metadata["ticker"], metadata["tanggal"],
+        metadata["seed"], metadata["mu"], metadata["sigma"],
+        metadata["periode"], metadata["days"],
+    )
+
+    with np.load(io.BytesIO(data)) as arsip:
+        assert sorted(arsip.files) == sorted(["finals", *metadata])
+        assert arsip["finals"].dtype == np.float64
+        np.testing.assert_array_equal(arsip["finals"], finals)
+        for kunci, nilai in metadata.items():
+            assert arsip[kunci].shape == ()
+            assert arsip[kunci].item() == nilai, kunci
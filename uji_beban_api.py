@@ -0,0 +1,97 @@
+"""
+Uji beban untuk api.py: kirim permintaan /proyeksi secara konkuren lalu
+laporkan throughput (permintaan/detik) dan persentil latensi. Keduanya
+dihitung dari jawaban 200 saja; kegagalan (503, error HTTP lain, timeout
+atau koneksi gagal = status 0) dilaporkan terpisah per status.
+
+Jalankan (dengan api.py sudah berjalan):
+    python uji_beban_api.py --url http://127.0.0.1:8502 --klien 16 --permintaan 400
+"""
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+import numpy as np
+
+from simulasi import HORIZONS, TICKER_OPTIONS
+
+
+def kirim(url: str, timeout: float) -> Tuple[float, int]:
+    """Kirim satu GET. Returns (latensi_detik, status_http)."""
+    mulai = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            resp.read()
+            status = resp.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except (urllib.error.URLError, TimeoutError):
+        status = 0
+    return time.perf_counter() - mulai, status
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://127.0.0.1:8502")
+    parser.add_argument("--klien", type=int, default=16,
+                        help="jumlah klien konkuren")
+    parser.add_argument("--permintaan", type=int, default=400,
+                        help="total permintaan")
+    parser.add_argument("--ticker", nargs="*", default=["BTC-USD", "ETH-USD", "SOL-USD"],
+                        help="ticker yang diacak; kosongkan untuk semua ticker")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    tickers = args.ticker or TICKER_OPTIONS
+    urls = [
+        f"{args.url}/proyeksi?ticker={rng.choice(tickers)}&days={rng.choice(HORIZONS)}"
+        for _ in range(args.permintaan)
+    ]
+
+    hasil: List[Tuple[float, int]] = []
+    lock = threading.Lock()
+
+    def tugas(url: str) -> None:
+        r = kirim(url, args.timeout)
+        with lock:
+            hasil.append(r)
+
+    mulai = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.klien) as pool:
+        list(pool.map(tugas, urls))
+    durasi = time.perf_counter() - mulai
+
+    latensi = np.array([r[0] for r in hasil if r[1] == 200]) * 1000
+    gagal   = Counter(r[1] for r in hasil if r[1] != 200)
+
+    print(f"Permintaan : {len(hasil)} ({len(latensi)} sukses, "
+          f"{sum(gagal.values())} gagal)")
+    if gagal:
+        rincian = ", ".join(
+            f"{'timeout/koneksi' if status == 0 else status}: {n}"
+            for status, n in sorted(gagal.items())
+        )
+        print(f"Gagal      : {rincian}")
+    print(f"Klien      : {args.klien}")
+    print(f"Durasi     : {durasi:.2f} s")
+    print(f"Throughput : {len(latensi) / durasi:.1f} permintaan sukses/detik")
+    if len(latensi):
+        p50, p95, p99 = np.percentile(latensi, [50, 95, 99])
+        print(f"Latensi ms : p50={p50:.1f}  p95={p95:.1f}  p99={p99:.1f}  "
+              f"maks={latensi.max():.1f}  (hanya sukses)")
+    else:
+        print("Latensi ms : - (tidak ada permintaan sukses)")
+
+
+if __name__ == "__main__":
+    main()
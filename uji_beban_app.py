@@ -0,0 +1,302 @@
+"""
+Uji beban sesi konkuren untuk app.py dengan backend CoinGecko tiruan.
+
+Menjalankan app.py sungguhan lewat streamlit.testing.v1.AppTest. Setiap
+pengguna tiruan adalah satu sesi yang berulang kali memilih ticker & horizon
+acak. ambil_data_harga diarahkan ke server CoinGecko lokal dengan latensi
+dan injeksi 429 yang bisa diatur. Untuk tiap jumlah pengguna dilaporkan
+throughput dan latensi rerun p50/p95/p99 (hanya rerun sukses), jumlah rerun
+gagal, dan puncak RSS proses.
+
+Jalankan:
+    python uji_beban_app.py --pengguna 1 2 4 8 --interaksi 10 --latensi-ms 200 --rasio-429 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import resource
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from simulasi import HORIZONS, MAX_PERIOD, TICKER_OPTIONS
+
+APP_PATH = Path(__file__).with_name("app.py")
+
+# ════════════════════════════════════════════════
+# COINGECKO TIRUAN
+# ════════════════════════════════════════════════
+
+class HandlerCoinGecko(BaseHTTPRequestHandler):
+    """Meniru /coins/{id}/market_chart dengan harga random walk deterministik."""
+
+    server: "ServerCoinGecko"
+
+    def do_GET(self) -> None:
+        time.sleep(self.server.latensi)
+
+        bagian = self.path.split("?")[0].strip("/").split("/")
+        if len(bagian) != 3 or bagian[0] != "coins" or bagian[2] != "market_chart":
+            self.send_error(404)
+            return
+        if self.server.rng_429.random() < self.server.rasio_429:
+            self.send_error(429, "Too Many Requests")
+            return
+
+        coin_id = bagian[1]
+        rng   = np.random.default_rng(zlib.crc32(coin_id.encode()))
+        n     = MAX_PERIOD + 1
+        harga = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.03, n)))
+        akhir = int(time.time() // 86400) * 86400 * 1000
+        waktu = akhir - np.arange(n)[::-1] * 86_400_000
+        body  = json.dumps(
+            {"prices": [[int(t), float(p)] for t, p in zip(waktu, harga)]}
+        ).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class ServerCoinGecko(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latensi: float, rasio_429: float, seed: int) -> None:
+        super().__init__(("127.0.0.1", 0), HandlerCoinGecko)
+        self.latensi = latensi
+        self.rasio_429 = rasio_429
+        self.rng_429 = random.Random(seed)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+# ════════════════════════════════════════════════
+# PENGUKURAN RSS
+# ════════════════════════════════════════════════
+
+def rss_sekarang() -> Optional[int]:
+    """RSS proses saat ini (byte) dari /proc, None jika tidak tersedia."""
+    try:
+        with open("/proc/self/status") as f:
+            for baris in f:
+                if baris.startswith("VmRSS:"):
+                    return int(baris.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+class PemantauRSS:
+    """Sampel RSS secara berkala di thread latar dan simpan puncaknya."""
+
+    def __init__(self, interval: float = 0.05) -> None:
+        self.interval = interval
+        self.puncak = 0
+        self._berhenti = threading.Event()
+        self._thread = threading.Thread(target=self._jalan, daemon=True)
+
+    def _jalan(self) -> None:
+        while not self._berhenti.is_set():
+            self.puncak = max(self.puncak, rss_sekarang() or 0)
+            self._berhenti.wait(self.interval)
+
+    def __enter__(self) -> "PemantauRSS":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._berhenti.set()
+        self._thread.join()
+        if not self.puncak:
+            # Fallback tanpa /proc: puncak seumur proses (KB di Linux).
+            self.puncak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+# ════════════════════════════════════════════════
+# PENGGUNA TIRUAN
+# ════════════════════════════════════════════════
+
+def siapkan_apptest_konkuren() -> None:
+    """
+    AppTest dirancang untuk satu sesi per proses. Agar banyak sesi bisa
+    berjalan paralel seperti di server Streamlit:
+
+    - Semua sesi memakai satu ScriptCache. AppTest membuat cache baru setiap
+      rerun sehingga app.py dikompilasi ulang tiap kali, dan kompilasi
+      paralel memicu ast.parse yang tidak thread-safe di CPython 3.11.
+    - Runtime tiruan terakhir tetap terlihat. AppTest mengosongkan
+      Runtime._instance di akhir setiap run, yang akan memutus sesi lain
+      yang masih berjalan.
+
+    Keduanya menambal internal Streamlit (diuji dengan streamlit 1.66.0);
+    bila internal tersebut berubah, fungsi ini gagal dengan RuntimeError
+    alih-alih menghasilkan angka yang diam-diam salah.
+    """
+    import streamlit
+    from streamlit.runtime.runtime import Runtime
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import app_test, local_script_runner
+
+    diperlukan = [
+        (Runtime, "instance"),
+        (Runtime, "exists"),
+        (Runtime, "_instance"),
+        (app_test, "ScriptCache"),
+        (local_script_runner, "ScriptCache"),
+    ]
+    hilang = [f"{getattr(o, '__name__', o)}.{a}" for o, a in diperlukan
+              if not hasattr(o, a)]
+    if hilang:
+        raise RuntimeError(
+            f"Internal Streamlit {streamlit.__version__} tidak cocok dengan "
+            f"uji_beban_app.py (diuji dengan 1.66.0); tidak ditemukan: "
+            f"{', '.join(hilang)}."
+        )
+
+    bersama = ScriptCache()
+    app_test.ScriptCache = lambda: bersama
+    local_script_runner.ScriptCache = lambda: bersama
+
+    terakhir: List[Runtime] = []
+
+    def instance(cls) -> Runtime:
+        if cls._instance is not None:
+            terakhir[:] = [cls._instance]
+            return cls._instance
+        if terakhir:
+            return terakhir[0]
+        raise RuntimeError("Runtime hasn't been created!")
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(lambda cls: cls._instance is not None or bool(terakhir))
+
+
+def sesi_pengguna(
+    interaksi: int,
+    rng: random.Random,
+    timeout: float,
+) -> List[Tuple[float, bool]]:
+    """
+    Satu sesi app.py: muat halaman lalu ganti ticker & horizon secara acak.
+    Returns daftar (latensi_detik, sukses) per rerun.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(APP_PATH), default_timeout=timeout)
+    hasil = []
+    for i in range(interaksi + 1):
+        # Rerun yang gagal (mis. 429) tidak merender widget; cukup muat ulang.
+        if i > 0 and len(at.sidebar.selectbox):
+            at.sidebar.selectbox[0].set_value(rng.choice(TICKER_OPTIONS))
+            if len(at.radio):
+                at.radio(key="days").set_value(rng.choice(HORIZONS))
+        mulai = time.perf_counter()
+        try:
+            at.run()
+            sukses = not at.exception and not at.error
+        except RuntimeError:
+            # AppTest melempar RuntimeError bila rerun melewati timeout.
+            sukses = False
+        hasil.append((time.perf_counter() - mulai, sukses))
+    return hasil
+
+
+def jalankan_tahap(
+    n_pengguna: int,
+    interaksi: int,
+    seed: int,
+    timeout: float,
+) -> dict:
+    """Jalankan n_pengguna sesi konkuren dan ringkas hasilnya."""
+    import streamlit as st
+
+    # Setiap tahap dimulai dengan cache data dingin agar sebanding.
+    st.cache_data.clear()
+
+    semua: List[Tuple[float, bool]] = []
+    lock = threading.Lock()
+
+    def pekerja(idx: int) -> None:
+        r = sesi_pengguna(interaksi, random.Random(seed * 1000 + idx), timeout)
+        with lock:
+            semua.extend(r)
+
+    threads = [threading.Thread(target=pekerja, args=(i,)) for i in range(n_pengguna)]
+    with PemantauRSS() as rss:
+        mulai = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        durasi = time.perf_counter() - mulai
+
+    # Rerun gagal (429, timeout) biasanya cepat; jangan sampai mempercantik
+    # throughput dan persentil.
+    latensi = np.array([r[0] for r in semua if r[1]]) * 1000
+    if len(latensi):
+        p50, p95, p99 = np.percentile(latensi, [50, 95, 99])
+    else:
+        p50 = p95 = p99 = float("nan")
+    return {
+        "pengguna":   n_pengguna,
+        "rerun":      len(semua),
+        "gagal":      len(semua) - len(latensi),
+        "throughput": len(latensi) / durasi,
+        "p50":        p50,
+        "p95":        p95,
+        "p99":        p99,
+        "rss_mb":     rss.puncak / 2 ** 20,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pengguna", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="jumlah pengguna konkuren per tahap")
+    parser.add_argument("--interaksi", type=int, default=10,
+                        help="interaksi per pengguna setelah muat awal")
+    parser.add_argument("--latensi-ms", type=float, default=200.0,
+                        help="latensi respons CoinGecko tiruan")
+    parser.add_argument("--rasio-429", type=float, default=0.0,
+                        help="peluang CoinGecko tiruan membalas 429")
+    parser.add_argument("--timeout", type=float, default=120.0,
+                        help="batas waktu satu rerun (detik)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = ServerCoinGecko(args.latensi_ms / 1000, args.rasio_429, args.seed)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["COINGECKO_API_URL"] = server.url
+    siapkan_apptest_konkuren()
+
+    print(f"CoinGecko tiruan: {server.url} · latensi {args.latensi_ms:.0f} ms · "
+          f"429 {args.rasio_429:.0%}")
+    print("sukses/s dan persentil latensi hanya menghitung rerun sukses.")
+    print(f"{'pengguna':>8} {'rerun':>6} {'gagal':>6} {'sukses/s':>8} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'RSS MB':>8}")
+    try:
+        for n in args.pengguna:
+            r = jalankan_tahap(n, args.interaksi, args.seed, args.timeout)
+            print(f"{r['pengguna']:>8} {r['rerun']:>6} {r['gagal']:>6} "
+                  f"{r['throughput']:>8.2f} {r['p50']:>8.0f} {r['p95']:>8.0f} "
+                  f"{r['p99']:>8.0f} {r['rss_mb']:>8.0f}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()